@@ -5,16 +5,28 @@ Modified to use GitHub Secrets for sensitive information
 """
 
 import requests
+import asyncio
+import aiohttp
+import codecs
 import csv
 import time
 import logging
+import logging.handlers
 import os
+import random
 import smtplib
 import ssl
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from zoneinfo import ZoneInfo
 import pandas as pd
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
-import pytz
+from urllib3.util.retry import Retry
 from email.message import EmailMessage
 
 # === CONFIGURATION FROM ENVIRONMENT VARIABLES (GitHub Secrets) ===
@@ -25,6 +37,7 @@ BASE_URL = "https://server.smartlead.ai/api/v1"
 TARGET_LEADS = int(os.environ.get('TARGET_LEADS', '20000'))
 DAYS_WITHOUT_ACTIVITY = int(os.environ.get('DAYS_WITHOUT_ACTIVITY', '30'))
 EXCLUDE_CLIENT_IDS = [int(x.strip()) for x in os.environ.get('EXCLUDE_CLIENT_IDS', '1598').split(',') if x.strip()]
+IST_TZ = ZoneInfo("Asia/Kolkata")
 
 # Email configuration from environment (GitHub Secrets)
 SENDER_EMAIL = os.environ.get('SENDER_EMAIL')
@@ -41,6 +54,21 @@ GITHUB_SERVER_URL = os.environ.get('GITHUB_SERVER_URL', 'https://github.com')
 # === RETRY CONFIGURATION ===
 MAX_RETRIES = 5
 BACKOFF_FACTOR = 2
+BACKOFF_MAX = 14            # cap incl. jitter; stays under aiohttp's 15 s keep-alive
+BACKOFF_JITTER = 0.5        # random extra seconds added to each backoff, before the cap
+
+# === DELETION CONCURRENCY ===
+DELETE_CONCURRENCY = 16     # max in-flight DELETE requests
+DELETE_RATE_LIMIT = 10      # starting DELETE requests per second
+DELETE_RATE_LIMIT_MIN = 1   # floor when the server pushes back
+DELETE_RATE_LIMIT_MAX = 20  # ceiling for additive increase
+DELETE_BATCH_SIZE = 200     # lead IDs per bulk-delete request
+DELETE_CHUNK_ROWS = 5000    # backup rows loaded per deletion round
+
+# === EXPORT CONCURRENCY ===
+EXPORT_WORKERS = 16         # parallel leads-export downloads
+EXPORT_CHUNK_BYTES = 1 << 20  # read size while streaming an export
+PARQUET_BATCH_ROWS = 5000   # backup rows buffered per Parquet write
 
 def validate_environment():
     """Validate that all required environment variables are set"""
@@ -80,27 +108,97 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
-    # File handler
+    # File handler behind a MemoryHandler: records are held in memory and handed
+    # to the file every 1000 records (or at once on ERROR). This defers the
+    # writes but does not batch them; FileHandler still flushes per record.
     file_handler = logging.FileHandler(log_filename)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    memory_handler = logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler)
+    logger.addHandler(memory_handler)
     
     return logger, log_filename
 
 # === HTTP REQUEST UTILITY ===
-def send_request(method, url, params=None, data=None, logger=None):
-    """Send HTTP request with retries and exponential backoff"""
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = requests.request(method, url, params=params, json=data, timeout=30)
-            response.raise_for_status()
-            return response
-        except (HTTPError, ConnectionError, Timeout, RequestException) as e:
-            if logger:
-                logger.error(f"Request error on attempt {attempt} for URL {url}: {e}")
-            time.sleep(BACKOFF_FACTOR ** attempt)
+# Shared keep-alive session; retries and backoff are handled by urllib3
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        backoff_max=BACKOFF_MAX,
+        backoff_jitter=BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "DELETE", "POST"],
+    ),
+))
+
+def send_request(method, url, params=None, data=None, logger=None, stream=False):
+    """Send HTTP request through the shared session (retries with exponential backoff)"""
+    try:
+        response = SESSION.request(method, url, params=params, json=data, timeout=(5, 30), stream=stream)
+        response.raise_for_status()
+        return response
+    except (HTTPError, ConnectionError, Timeout, RequestException) as e:
+        if logger:
+            logger.error(f"Request failed for URL {url}: {e}")
     return None
 
+class AdaptiveRateLimiter:
+    """Async token bucket whose rate adapts (AIMD) to server rate-limit feedback"""
+
+    def __init__(self, rate, min_rate, max_rate):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._resume_at = 0.0                   # monotonic time before which nobody may send
+        self._last_decrease = float("-inf")     # monotonic time of the last rate halving
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._tokens = min(max(self.rate, 1.0), self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def update(self, status, headers, sent_at):
+        """Halve the rate on 429, otherwise probe upward unless X-RateLimit-Remaining is exhausted.
+        
+        sent_at is the monotonic time the request was sent; 429s for requests
+        sent before the last decrease belong to the same overload event and
+        don't halve the rate again.
+        """
+        if status == 429:
+            now = time.monotonic()
+            retry_after = headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                self._resume_at = max(self._resume_at, now + int(retry_after))
+            if sent_at > self._last_decrease:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._last_decrease = now
+            return
+        
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        if remaining.isdigit() and int(remaining) == 0:
+            return
+        if status < 500:
+            self.rate = min(self.max_rate, self.rate + 1 / self.rate)
+
 # === EMAIL FUNCTIONALITY ===
 def send_email(subject, body, attachments=[], logger=None):
     """Send email with attachments"""
@@ -111,6 +209,10 @@ def send_email(subject, body, attachments=[], logger=None):
         msg["Subject"] = subject
         msg.set_content(body)
 
+        # Make sure buffered log records are on disk before attaching the log
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
         for file_path in attachments:
             if os.path.isfile(file_path):
                 with open(file_path, "rb") as f:
@@ -143,49 +245,88 @@ def fetch_all_campaigns(api_key, logger):
     response = send_request("GET", url, params=params, logger=logger)
     
     if response:
-        campaigns = response.json()
+        campaigns = orjson.loads(response.content)
         logger.info(f"Retrieved {len(campaigns)} campaigns")
         return campaigns
     
     logger.error("Failed to retrieve campaigns")
     return []
 
-def export_leads_csv(api_key, campaign_id, logger, export_folder="exports"):
-    """Export leads CSV for a specific campaign"""
-    os.makedirs(export_folder, exist_ok=True)
-    csv_filename = os.path.join(export_folder, f"leads_campaign_{campaign_id}.csv")
+def fetch_campaign_lead_total(api_key, campaign_id, logger):
+    """Return a campaign's total lead count from its analytics, or None if unavailable"""
+    url = f"{BASE_URL}/campaigns/{campaign_id}/analytics"
+    params = {"api_key": api_key}
+    response = send_request("GET", url, params=params, logger=logger)
     
-    # Remove stale file
-    if os.path.isfile(csv_filename):
-        os.remove(csv_filename)
-        logger.info(f"Removed stale CSV for campaign {campaign_id}")
+    if response:
+        try:
+            return int(orjson.loads(response.content)["campaign_lead_stats"]["total"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Unexpected analytics response for campaign {campaign_id}")
+    return None
+
+def iter_csv_lines(response):
+    """Yield decoded lines of a streamed CSV body, reading EXPORT_CHUNK_BYTES at a time.
+    
+    Lines are split on LF only, with the newline kept, so CRLF pairs and
+    quoted multi-line fields reach the csv reader intact.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    for chunk in response.iter_content(chunk_size=EXPORT_CHUNK_BYTES, decode_unicode=False):
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+def export_and_filter_no_reply(api_key, campaign_id, run_ts, logger, export_folder="exports"):
+    """Stream a campaign's leads export, keeping only no-reply leads.
+    
+    Files are named per run (run_ts), so a previous run's file is never reused.
+    Returns (campaign_id, no_reply_csv or None, total_leads, no_reply_count);
+    no_reply_csv is None when the export failed or the campaign has no leads.
+    """
+    # The analytics summary is far cheaper than the export; skip empty campaigns
+    if fetch_campaign_lead_total(api_key, campaign_id, logger) == 0:
+        logger.debug(f"Campaign {campaign_id} has no leads, skipping export")
+        return campaign_id, None, 0, 0
+    
+    os.makedirs(export_folder, exist_ok=True)
+    csv_filename = os.path.join(export_folder, f"no_reply_leads_campaign_{campaign_id}_{run_ts}.csv")
 
     url = f"{BASE_URL}/campaigns/{campaign_id}/leads-export"
     params = {"api_key": api_key}
-    response = send_request("GET", url, params=params, logger=logger)
+    response = send_request("GET", url, params=params, logger=logger, stream=True)
     
-    if response and response.status_code == 200 and 'text/csv' in response.headers.get('Content-Type', ''):
-        with open(csv_filename, "wb") as f:
-            f.write(response.content)
-        logger.info(f"Exported leads to {csv_filename} for campaign {campaign_id}")
-        return csv_filename
+    if not (response and response.status_code == 200 and 'text/csv' in response.headers.get('Content-Type', '')):
+        if response:
+            response.close()
+        logger.error(f"Failed to export leads for campaign {campaign_id}")
+        return campaign_id, None, 0, 0
     
-    logger.error(f"Failed to export leads for campaign {campaign_id}")
-    return None
-
-def analyze_campaign_leads(csv_file, logger):
-    """Analyze leads CSV and return statistics"""
+    total_leads = 0
+    no_reply_count = 0
     try:
-        df = pd.read_csv(csv_file)
-        total_leads = len(df)
-        no_reply_leads = df[df['reply_count'] == 0]
-        no_reply_count = len(no_reply_leads)
-        
-        logger.info(f"Campaign analysis: {total_leads} total leads, {no_reply_count} no-reply leads")
-        return no_reply_leads, total_leads, no_reply_count
+        with response, open(csv_filename, "w", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(iter_csv_lines(response))
+            writer = csv.DictWriter(f, fieldnames=reader.fieldnames or [])
+            if reader.fieldnames:
+                writer.writeheader()
+            
+            for row in reader:
+                total_leads += 1
+                if row.get("reply_count") == "0":
+                    writer.writerow(row)
+                    no_reply_count += 1
     except Exception as e:
-        logger.error(f"Error analyzing {csv_file}: {e}")
-        return pd.DataFrame(), 0, 0
+        logger.error(f"Error streaming leads for campaign {campaign_id}: {e}")
+        return campaign_id, None, 0, 0
+    
+    logger.debug(f"Campaign {campaign_id}: {total_leads} total leads, {no_reply_count} no-reply leads -> {csv_filename}")
+    return campaign_id, csv_filename, total_leads, no_reply_count
 
 # === MAIN PROCESSING LOGIC ===
 class SmartLeadProcessor:
@@ -193,6 +334,7 @@ class SmartLeadProcessor:
         self.api_key = api_key
         self.logger = logger
         self.log_filename = log_filename
+        self.run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.execution_stats = {
             'campaigns_fetched': 0,
             'campaigns_filtered': 0,
@@ -205,113 +347,114 @@ class SmartLeadProcessor:
             'execution_time': 0
         }
         self.output_files = []
+        self.analysis_df = None  # set by filter_and_analyze_campaigns
+        self.bulk_delete_supported = None  # unknown until the first bulk request
+        self._no_reply_cache = {}  # campaign_id -> (no-reply CSV, total leads, no-reply count)
 
     def filter_and_analyze_campaigns(self, campaigns):
         """Filter campaigns and create comprehensive analysis"""
         self.logger.info(f"Filtering {len(campaigns)} campaigns...")
         
-        # Setup timezone and cutoff date
-        ist_tz = pytz.timezone("Asia/Kolkata")
-        cutoff_date = datetime.now(ist_tz) - timedelta(days=DAYS_WITHOUT_ACTIVITY)
+        # Setup cutoff date; "now" is taken once for the whole analysis
+        now_ist = pd.Timestamp.now(tz=IST_TZ)
+        cutoff_date = now_ist - pd.Timedelta(days=DAYS_WITHOUT_ACTIVITY)
         
         # Output CSV for all campaigns
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         campaigns_csv = f"all_campaigns_analysis_{timestamp}.csv"
         self.output_files.append(campaigns_csv)
         
-        filtered_campaigns = []
-        
-        with open(campaigns_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Campaign ID", "Campaign Name", "Status", "Client ID",
-                "Created At (UTC)", "Created At (IST)", 
-                "Updated At (UTC)", "Updated At (IST)",
-                "Days Since Creation", "Included in Filter",
-                "Total Leads", "No Reply Leads", "Reply Rate %"
-            ])
-            
-            for campaign in campaigns:
-                try:
-                    campaign_id = campaign.get("id")
-                    campaign_name = campaign.get("name", "")
-                    status = campaign.get("status", "")
-                    client_id = campaign.get("client_id")
-                    
-                    # Parse timestamps
-                    created_utc = datetime.strptime(campaign["created_at"], "%Y-%m-%dT%H:%M:%S.%f%z")
-                    updated_utc = datetime.strptime(campaign["updated_at"], "%Y-%m-%dT%H:%M:%S.%f%z")
-                    created_ist = created_utc.astimezone(ist_tz)
-                    updated_ist = updated_utc.astimezone(ist_tz)
-                    
-                    days_since_creation = (datetime.now(ist_tz) - created_ist).days
-                    
-                    # Determine if campaign should be included
-                    include_campaign = (
-                        client_id not in EXCLUDE_CLIENT_IDS and
-                        status in ("PAUSED", "COMPLETED") and
-                        created_ist <= cutoff_date
-                    )
-                    
-                    total_leads = 0
-                    no_reply_leads = 0
-                    reply_rate = 0
-                    
-                    if include_campaign:
-                        filtered_campaigns.append(campaign)
-                        # Export and analyze leads for included campaigns
-                        leads_file = export_leads_csv(self.api_key, campaign_id, self.logger)
-                        if leads_file:
-                            _, total_leads, no_reply_leads = analyze_campaign_leads(leads_file, self.logger)
-                            reply_rate = ((total_leads - no_reply_leads) / total_leads * 100) if total_leads > 0 else 0
-                    
-                    writer.writerow([
-                        campaign_id, campaign_name, status, client_id,
-                        created_utc, created_ist, updated_utc, updated_ist,
-                        days_since_creation, "Yes" if include_campaign else "No",
-                        total_leads, no_reply_leads, f"{reply_rate:.1f}%"
-                    ])
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing campaign {campaign.get('id')}: {e}")
+        # Build only the fields the analysis uses, with pinned dtypes
+        df = pd.DataFrame(
+            campaigns, columns=["id", "name", "status", "client_id", "created_at", "updated_at"]
+        ).astype({"id": "int64", "client_id": "Int64"})
+        
+        # Parse timestamps
+        created_utc = pd.to_datetime(df["created_at"], utc=True, format="ISO8601", errors="coerce")
+        updated_utc = pd.to_datetime(df["updated_at"], utc=True, format="ISO8601", errors="coerce")
+        created_ist = created_utc.dt.tz_convert(IST_TZ)
+        updated_ist = updated_utc.dt.tz_convert(IST_TZ)
+        
+        valid = created_utc.notna() & updated_utc.notna()
+        for campaign_id in df.loc[~valid, "id"]:
+            self.logger.error(f"Error processing campaign {campaign_id}: invalid created_at/updated_at")
+        
+        # Drop unparseable rows up front so NaT never leaks into derived columns
+        df = df[valid]
+        created_utc, created_ist = created_utc[valid], created_ist[valid]
+        updated_utc, updated_ist = updated_utc[valid], updated_ist[valid]
+        
+        # Determine which campaigns should be included
+        include = (
+            ~df["client_id"].isin(EXCLUDE_CLIENT_IDS) &
+            df["status"].isin(["PAUSED", "COMPLETED"]) &
+            (created_ist <= cutoff_date)
+        )
+        
+        # Export leads for included campaigns in parallel
+        self.logger.info(f"Exporting leads for {include.sum()} campaigns...")
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            for campaign_id, leads_file, total_leads, no_reply_leads in executor.map(
+                lambda campaign_id: export_and_filter_no_reply(self.api_key, campaign_id, self.run_ts, self.logger),
+                df.loc[include, "id"].tolist()
+            ):
+                if leads_file:
+                    # Cached for create_deletion_backup so leads are exported only once
+                    self._no_reply_cache[campaign_id] = (leads_file, total_leads, no_reply_leads)
+        
+        total_leads = df["id"].map({cid: total for cid, (_, total, _) in self._no_reply_cache.items()})
+        no_reply_leads = df["id"].map({cid: no_reply for cid, (_, _, no_reply) in self._no_reply_cache.items()})
+        total_leads = total_leads.fillna(0).astype("int64")
+        no_reply_leads = no_reply_leads.fillna(0).astype("int64")
+        reply_rate = ((total_leads - no_reply_leads) / total_leads.where(total_leads > 0) * 100).fillna(0)
+        
+        # Format timestamps explicitly so every row renders the same way
+        timestamp_format = "%Y-%m-%d %H:%M:%S"
+        
+        analysis_df = pd.DataFrame({
+            "Campaign ID": df["id"],
+            "Campaign Name": df["name"],
+            "Status": df["status"],
+            "Client ID": df["client_id"],
+            "Created At (UTC)": created_utc.dt.strftime(timestamp_format),
+            "Created At (IST)": created_ist.dt.strftime(timestamp_format),
+            "Updated At (UTC)": updated_utc.dt.strftime(timestamp_format),
+            "Updated At (IST)": updated_ist.dt.strftime(timestamp_format),
+            "Days Since Creation": (now_ist - created_ist).dt.days,
+            "Included in Filter": np.where(include, "Yes", "No"),
+            "Total Leads": total_leads,
+            "No Reply Leads": no_reply_leads,
+            "Reply Rate %": reply_rate.map("{:.1f}%".format),
+        })
+        analysis_df.to_csv(campaigns_csv, index=False)
+        
+        # Kept in memory for select_campaigns_for_deletion; the CSV is for the email
+        self.analysis_df = analysis_df
+        filtered_df = analysis_df[analysis_df["Included in Filter"] == "Yes"]
         
         self.execution_stats['campaigns_fetched'] = len(campaigns)
-        self.execution_stats['campaigns_filtered'] = len(filtered_campaigns)
+        self.execution_stats['campaigns_filtered'] = len(filtered_df)
         
         self.logger.info(f"Created comprehensive campaigns analysis: {campaigns_csv}")
-        self.logger.info(f"Filtered to {len(filtered_campaigns)} eligible campaigns")
+        self.logger.info(f"Filtered to {len(filtered_df)} eligible campaigns")
         
-        return filtered_campaigns
+        return filtered_df, analysis_df
 
-    def select_campaigns_for_deletion(self, filtered_campaigns):
+    def select_campaigns_for_deletion(self):
         """Select campaigns to reach target lead count"""
         self.logger.info(f"Selecting campaigns to reach ~{TARGET_LEADS:,} no-reply leads...")
         
-        # Read campaign analysis to get lead counts
-        campaigns_df = pd.read_csv(self.output_files[-1])  # Latest campaigns CSV
-        campaigns_df = campaigns_df[campaigns_df["Included in Filter"] == "Yes"]
-        campaigns_df["No Reply Leads"] = pd.to_numeric(campaigns_df["No Reply Leads"], errors="coerce")
+        campaigns_df = self.analysis_df[self.analysis_df["Included in Filter"] == "Yes"]
+        campaigns_df = campaigns_df[campaigns_df["No Reply Leads"] > 0]
         
         # Sort by no-reply leads (descending)
         campaigns_sorted = campaigns_df.sort_values(by="No Reply Leads", ascending=False)
         
-        # Select campaigns to reach target
-        selected_indices = []
-        cumulative_leads = 0
-        
-        for idx, row in campaigns_sorted.iterrows():
-            no_reply_count = int(row["No Reply Leads"])
-            if no_reply_count <= 0:
-                continue
-                
-            selected_indices.append(idx)
-            cumulative_leads += no_reply_count
-            
-            if cumulative_leads >= TARGET_LEADS:
-                break
-        
-        # Return DataFrame slice instead of list
-        selected_campaigns = campaigns_sorted.loc[selected_indices]
+        # Take campaigns up to and including the one that reaches the target
+        cumulative = campaigns_sorted["No Reply Leads"].cumsum()
+        k = int(cumulative.searchsorted(TARGET_LEADS)) + 1
+        selected_campaigns = campaigns_sorted.iloc[:k]
+        cumulative_leads = int(selected_campaigns["No Reply Leads"].sum())
         
         self.execution_stats['campaigns_selected'] = len(selected_campaigns)
         
@@ -319,105 +462,230 @@ class SmartLeadProcessor:
         return selected_campaigns
 
     def create_deletion_backup(self, selected_campaigns):
-        """Export and backup all leads to be deleted"""
+        """Backup all leads to be deleted from the cached no-reply exports"""
         self.logger.info("Creating backup of leads to be deleted...")
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_csv = f"leads_deletion_backup_{timestamp}.csv"
+        backup_parquet = f"leads_deletion_backup_{timestamp}.parquet"
         self.output_files.append(backup_csv)
         
-        all_deletion_leads = []
+        deletion_files = []
         
         for _, campaign_row in selected_campaigns.iterrows():
             campaign_id = campaign_row["Campaign ID"]
             campaign_name = campaign_row["Campaign Name"]
             
-            self.logger.info(f"Processing campaign {campaign_id}: {campaign_name}")
+            self.logger.debug(f"Processing campaign {campaign_id}: {campaign_name}")
             
-            # Export leads for this campaign
-            leads_file = export_leads_csv(self.api_key, campaign_id, self.logger)
-            if not leads_file:
-                self.logger.error(f"Failed to export leads for campaign {campaign_id}")
+            if campaign_id not in self._no_reply_cache:
+                self.logger.error(f"No exported leads for campaign {campaign_id}")
                 continue
-                
-            # Filter no-reply leads
-            no_reply_df, total_leads, no_reply_count = analyze_campaign_leads(leads_file, self.logger)
+            leads_file, total_leads, no_reply_count = self._no_reply_cache[campaign_id]
             
-            if not no_reply_df.empty:
-                # Add campaign metadata
-                no_reply_df["Campaign ID"] = campaign_id
-                no_reply_df["Campaign Name"] = campaign_name
-                no_reply_df["Backup Timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                all_deletion_leads.append(no_reply_df)
+            if no_reply_count:
+                deletion_files.append((campaign_id, campaign_name, leads_file))
                 self.execution_stats['total_leads_exported'] += total_leads
                 self.execution_stats['no_reply_leads_found'] += no_reply_count
         
-        if all_deletion_leads:
-            # Combine all deletion leads
-            backup_df = pd.concat(all_deletion_leads, ignore_index=True)
-            backup_df.to_csv(backup_csv, index=False)
+        if deletion_files:
+            # Columns differ between campaigns (custom fields), so write their union
+            fieldnames = {}
+            for _, _, leads_file in deletion_files:
+                with open(leads_file, newline="", encoding="utf-8") as f:
+                    fieldnames.update(dict.fromkeys(next(csv.reader(f))))
+                fieldnames.update(dict.fromkeys(["Campaign ID", "Campaign Name", "Backup Timestamp"]))
+            
+            # CSV is for the email; typed Parquet copy is what delete_leads reads back
+            schema = pa.schema([
+                (name, pa.int64() if name in ("Campaign ID", "id") else pa.string())
+                for name in fieldnames
+            ])
             
-            self.execution_stats['leads_backed_up'] = len(backup_df)
-            self.logger.info(f"Backup created: {backup_csv} with {len(backup_df):,} leads")
-            return backup_csv, backup_df
+            leads_backed_up = 0
+            parquet_rows = []
+            with open(backup_csv, "w", newline="", encoding="utf-8") as out, \
+                    pq.ParquetWriter(backup_parquet, schema, compression="zstd") as parquet_writer:
+                writer = csv.DictWriter(out, fieldnames=list(fieldnames))
+                writer.writeheader()
+                for campaign_id, campaign_name, leads_file in deletion_files:
+                    # Add campaign metadata
+                    backup_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    with open(leads_file, newline="", encoding="utf-8") as f:
+                        for lead in csv.DictReader(f):
+                            lead["Campaign ID"] = campaign_id
+                            lead["Campaign Name"] = campaign_name
+                            lead["Backup Timestamp"] = backup_timestamp
+                            writer.writerow(lead)
+                            leads_backed_up += 1
+                            
+                            lead_id = lead.get("id") or ""
+                            parquet_rows.append({
+                                **lead,
+                                "Campaign ID": int(campaign_id),
+                                "id": int(lead_id) if lead_id.isdigit() else None,
+                            })
+                            if len(parquet_rows) >= PARQUET_BATCH_ROWS:
+                                parquet_writer.write_table(pa.Table.from_pylist(parquet_rows, schema=schema))
+                                parquet_rows = []
+                if parquet_rows:
+                    parquet_writer.write_table(pa.Table.from_pylist(parquet_rows, schema=schema))
+            
+            self.execution_stats['leads_backed_up'] = leads_backed_up
+            self.logger.info(f"Backup created: {backup_csv} with {leads_backed_up:,} leads")
+            return backup_parquet, leads_backed_up
         
         self.logger.warning("No leads found for backup")
-        return None, pd.DataFrame()
+        return None, 0
 
-    def delete_leads(self, backup_df):
+    def delete_leads(self, backup_parquet):
         """Delete leads using SmartLead API"""
-        if backup_df.empty:
+        backup_file = pq.ParquetFile(backup_parquet)
+        total = backup_file.metadata.num_rows
+        if total == 0:
             self.logger.info("No leads to delete")
             return
             
-        self.logger.info(f"Starting deletion of {len(backup_df):,} leads...")
+        self.logger.info(f"Starting deletion of {total:,} leads...")
         
-        success_count = 0
-        failed_count = 0
-        
-        for idx, row in backup_df.iterrows():
-            campaign_id = row.get("Campaign ID")
-            lead_id = row.get("id")
-            
-            if pd.isna(campaign_id) or pd.isna(lead_id):
-                self.logger.error(f"Row {idx}: Missing Campaign ID or Lead ID")
-                failed_count += 1
-                continue
-            
-            # Delete lead via API
-            if self.delete_single_lead(campaign_id, lead_id):
-                success_count += 1
-            else:
-                failed_count += 1
-            
-            # Rate limiting
-            time.sleep(0.5)
-            
-            # Progress logging every 100 deletions
-            if (success_count + failed_count) % 100 == 0:
-                self.logger.info(f"Progress: {success_count + failed_count:,}/{len(backup_df):,} processed")
+        success_count, failed_count = asyncio.run(self._delete_leads_async(backup_file, total))
         
         self.execution_stats['leads_deleted_success'] = success_count
         self.execution_stats['leads_deleted_failed'] = failed_count
         
         self.logger.info(f"Deletion completed: {success_count:,} successful, {failed_count:,} failed")
 
-    def delete_single_lead(self, campaign_id, lead_id):
-        """Delete a single lead via API"""
-        url = f"{BASE_URL}/campaigns/{campaign_id}/leads/{lead_id}"
-        params = {"api_key": self.api_key}
+    def _lead_batches(self, chunk):
+        """Group a chunk of (Campaign ID, id) rows into bulk-sized batches per campaign"""
+        valid_df = chunk.dropna(subset=["Campaign ID", "id"])
+        missing_count = len(chunk) - len(valid_df)
+        if missing_count:
+            self.logger.error(f"{missing_count:,} rows missing Campaign ID or Lead ID")
+        
+        batches = []
+        for campaign_id, group in valid_df.groupby("Campaign ID"):
+            lead_ids = group["id"].astype("int64").to_numpy()
+            n_batches = -(-len(lead_ids) // DELETE_BATCH_SIZE)
+            for batch in np.array_split(lead_ids, n_batches):
+                batches.append((int(campaign_id), batch.tolist()))
+        return batches, missing_count
+
+    async def _delete_leads_async(self, backup_file, total):
+        """Delete leads chunk by chunk, dispatching each chunk's batches concurrently"""
+        success_count = 0
+        failed_count = 0
         
-        response = send_request("DELETE", url, params=params, logger=self.logger)
+        self._sem = asyncio.Semaphore(DELETE_CONCURRENCY)
+        self._limiter = AdaptiveRateLimiter(DELETE_RATE_LIMIT, DELETE_RATE_LIMIT_MIN, DELETE_RATE_LIMIT_MAX)
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=16)
+        timeout = aiohttp.ClientTimeout(total=30)
         
-        if response and response.status_code == 200:
-            return True
-        elif response and response.status_code == 404:
-            self.logger.warning(f"Lead {lead_id} already deleted")
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            
+            async def _one(campaign_id, lead_id):
+                """Delete a single lead via API"""
+                url = f"{BASE_URL}/campaigns/{campaign_id}/leads/{lead_id}"
+                status, _ = await self._send_async(session, "DELETE", url, params={"api_key": self.api_key})
+                
+                if status == 200:
+                    return True, status
+                if status == 404:
+                    self.logger.debug(f"Lead {lead_id} already deleted")
+                    return True, status
+                self.logger.error(f"Failed to delete lead {lead_id} from campaign {campaign_id}")
+                return False, status
+            
+            async def _batch(campaign_id, lead_ids):
+                """Delete a batch of leads, falling back to per-ID requests"""
+                if self.bulk_delete_supported is not False:
+                    if await self.delete_leads_bulk(session, campaign_id, lead_ids):
+                        return len(lead_ids), 0
+                
+                results = await asyncio.gather(*(_one(campaign_id, lead_id) for lead_id in lead_ids))
+                succeeded = sum(1 for ok, _ in results if ok)
+                return succeeded, len(lead_ids) - succeeded
+            
+            # Only the IDs are needed for deletion; load them a chunk at a time
+            for record_batch in backup_file.iter_batches(batch_size=DELETE_CHUNK_ROWS, columns=["Campaign ID", "id"]):
+                batches, missing_count = self._lead_batches(record_batch.to_pandas())
+                failed_count += missing_count
+                if not batches:
+                    continue
+                
+                # Probe the bulk endpoint with the first batch before fanning out
+                if self.bulk_delete_supported is None:
+                    succeeded, failed = await _batch(*batches.pop(0))
+                    success_count += succeeded
+                    failed_count += failed
+                
+                for future in asyncio.as_completed([_batch(*batch) for batch in batches]):
+                    succeeded, failed = await future
+                    success_count += succeeded
+                    failed_count += failed
+                    self.logger.debug(f"Progress: {success_count + failed_count:,}/{total:,} processed")
+                
+                self.logger.info(f"Progress: {success_count + failed_count:,}/{total:,} processed")
+        
+        return success_count, failed_count
+
+    async def delete_leads_bulk(self, session, campaign_id, lead_ids):
+        """Delete many leads of one campaign in a single request.
+        
+        Returns True only when the response confirms every lead was deleted;
+        otherwise the batch is retried per-ID (404 there counts as deleted, so
+        a partial bulk delete is still accounted correctly). The first call
+        probes the endpoint: anything but a confirmed success disables bulk
+        mode for the rest of the run.
+        """
+        url = f"{BASE_URL}/campaigns/{campaign_id}/leads/bulk-delete"
+        status, body = await self._send_async(session, "POST", url, params={"api_key": self.api_key},
+                                              data={"lead_ids": lead_ids})
+        
+        deleted_count = None
+        if status == 200:
+            try:
+                result = orjson.loads(body)
+                deleted_count = int(result.get("deleted_count", result.get("deleted")))
+            except (ValueError, TypeError, AttributeError):
+                pass
+        
+        if deleted_count == len(lead_ids):
+            self.bulk_delete_supported = True
             return True
+        
+        if self.bulk_delete_supported is None:
+            self.logger.info(f"Bulk delete endpoint not usable (HTTP {status}), falling back to per-lead deletion")
+            self.bulk_delete_supported = False
+        elif status == 200:
+            self.logger.error(f"Bulk delete for campaign {campaign_id} confirmed {deleted_count} of "
+                              f"{len(lead_ids)} leads, retrying per lead")
         else:
-            self.logger.error(f"Failed to delete lead {lead_id} from campaign {campaign_id}")
-            return False
+            self.logger.error(f"Bulk delete failed for campaign {campaign_id} (HTTP {status}), retrying per lead")
+        return False
+
+    async def _send_async(self, session, method, url, params=None, data=None):
+        """Send a throttled async request with retries, returning (HTTP status, body)"""
+        status = None
+        body = None
+        
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                async with self._sem, self._limiter:
+                    sent_at = time.monotonic()
+                    async with session.request(method, url, params=params, json=data) as resp:
+                        status = resp.status
+                        body = await resp.read()
+                        self._limiter.update(status, resp.headers, sent_at)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Request error on attempt {attempt} for URL {url}: {e!r}")
+            else:
+                if status != 429 and status < 500:
+                    return status, body
+                self.logger.warning(f"Request error on attempt {attempt} for URL {url}: HTTP {status}")
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(min(BACKOFF_FACTOR ** attempt + random.uniform(0, BACKOFF_JITTER), BACKOFF_MAX))
+        
+        return status, body
 
     def send_completion_email(self):
         """Send detailed completion email with attachments"""
@@ -486,25 +754,25 @@ The deletion process has been completed successfully. All deleted leads have bee
             
             # Step 2: Filter and analyze campaigns
             self.logger.info("=== STEP 2: Filtering and Analyzing Campaigns ===")
-            filtered_campaigns = self.filter_and_analyze_campaigns(campaigns)
-            if not filtered_campaigns:
+            filtered_campaigns, _ = self.filter_and_analyze_campaigns(campaigns)
+            if filtered_campaigns.empty:
                 raise Exception("No campaigns match filter criteria")
             
             # Step 3: Select campaigns for deletion
             self.logger.info("=== STEP 3: Selecting Campaigns for Deletion ===")
-            selected_campaigns = self.select_campaigns_for_deletion(filtered_campaigns)
+            selected_campaigns = self.select_campaigns_for_deletion()
             if len(selected_campaigns) == 0:
                 raise Exception("No campaigns selected for deletion")
             
             # Step 4: Create backup
             self.logger.info("=== STEP 4: Creating Deletion Backup ===")
-            backup_file, backup_df = self.create_deletion_backup(selected_campaigns)
-            if backup_df.empty:
+            backup_file, leads_backed_up = self.create_deletion_backup(selected_campaigns)
+            if not leads_backed_up:
                 raise Exception("No leads found for backup")
             
             # Step 5: Delete leads
             self.logger.info("=== STEP 5: Deleting Leads ===")
-            self.delete_leads(backup_df)
+            self.delete_leads(backup_file)
             
             # Calculate execution time
             self.execution_stats['execution_time'] = time.time() - start_time
@@ -0,0 +1,48 @@
+import asyncio
+import csv
+import time
+
+from smartlead_consolidated_git import AdaptiveRateLimiter, iter_csv_lines
+
+
+def test_concurrent_429s_halve_once_and_honour_retry_after():
+    async def scenario():
+        limiter = AdaptiveRateLimiter(10, 1, 20)
+        sent_at = time.monotonic()
+        # A burst of in-flight requests all rejected by the same overload event
+        for _ in range(16):
+            limiter.update(429, {"Retry-After": "1"}, sent_at)
+        assert limiter.rate == 5
+        
+        start = time.monotonic()
+        async with limiter:
+            pass
+        return time.monotonic() - start
+
+    waited = asyncio.run(scenario())
+    assert 0.9 <= waited < 1.5
+
+
+def test_429_after_decrease_halves_again():
+    limiter = AdaptiveRateLimiter(10, 1, 20)
+    limiter.update(429, {}, time.monotonic())
+    limiter.update(429, {}, time.monotonic())
+    assert limiter.rate == 2.5
+
+
+class _ChunkedResponse:
+    def __init__(self, body, size):
+        self._chunks = [body[i:i + size] for i in range(0, len(body), size)]
+
+    def iter_content(self, chunk_size, decode_unicode):
+        return iter(self._chunks)
+
+
+def test_iter_csv_lines_keeps_rows_intact_across_chunks():
+    body = '\ufeffid,note,reply_count\r\n1,"multi\r\nline é",0\r\n2,plain,3'.encode("utf-8")
+    for size in range(1, len(body) + 1):
+        rows = list(csv.DictReader(iter_csv_lines(_ChunkedResponse(body, size))))
+        assert rows == [
+            {"id": "1", "note": "multi\r\nline é", "reply_count": "0"},
+            {"id": "2", "note": "plain", "reply_count": "3"},
+        ]